@@ -1,8 +1,22 @@
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, jsonify, request, render_template, g, current_app
 from flask_restx import Api, Resource, fields, Namespace
+from flask_restx.mask import apply as apply_mask
+from werkzeug.middleware.proxy_fix import ProxyFix
+import gzip
+import hashlib
 import json
+import math
+import operator
 import os
 import requests
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from contextlib import contextmanager
 
 app = Flask(__name__)
 
@@ -77,67 +91,66 @@ def search_nasa_images(query="", year="", page=1, page_size=20):
         return {'items': [], 'total': 0}
 
 # Data loading functions
+_record_cache = {}
+
+def load_records(path, key, record_class):
+    """Load a collection as record objects, parsing the file again only when it changes"""
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _record_cache.get(path)
+    if cached is None or cached[0] != signature:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        cached = (signature, [record_class(item) for item in data[key]])
+        _record_cache[path] = cached
+    # Handlers filter and sort in place, so hand out a copy of the list
+    return list(cached[1])
+
 def load_space_terms():
     try:
-        with open('data/space_terminology.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['space_terms']
+        return load_records('data/space_terminology.json', 'space_terms', TermRecord)
     except FileNotFoundError:
         return []
 
 def load_space_agencies():
     try:
-        with open('data/space_agencies.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['space_agencies']
+        return load_records('data/space_agencies.json', 'space_agencies', AgencyRecord)
     except FileNotFoundError:
         return []
 
 def load_planets():
     try:
-        with open('data/planets.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['planets']
+        return load_records('data/planets.json', 'planets', PlanetRecord)
     except FileNotFoundError:
         return []
 
 def load_rockets():
     try:
-        with open('data/rockets.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['rockets']
+        return load_records('data/rockets.json', 'rockets', RocketRecord)
     except FileNotFoundError:
         return []
 
 def load_astronauts():
     try:
-        with open('data/astronauts.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['astronauts']
+        return load_records('data/astronauts.json', 'astronauts', AstronautRecord)
     except FileNotFoundError:
         return []
 
 def load_telescopes():
     try:
-        with open('data/telescopes.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['telescopes']
+        return load_records('data/telescopes.json', 'telescopes', TelescopeRecord)
     except FileNotFoundError:
         return []
 
 def load_museums():
     try:
-        with open('data/space_museams.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['space_museums']
+        return load_records('data/space_museams.json', 'space_museums', MuseumRecord)
     except FileNotFoundError:
         return []
 
 def load_notable_people():
     try:
-        with open('data/notable_peoples.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data['notable_space_contributors']
+        return load_records('data/notable_peoples.json', 'notable_space_contributors', NotablePersonRecord)
     except FileNotFoundError:
         return []
 
@@ -151,6 +164,7 @@ telescopes_ns = Namespace('telescopes', description='Telescopes and observatorie
 museums_ns = Namespace('museums', description='Space museums and centers')
 people_ns = Namespace('people', description='Notable space contributors')
 images_ns = Namespace('images', description='Space images from NASA')
+sync_ns = Namespace('sync', description='Incremental catalogue sync for mirrors')
 
 api.add_namespace(terms_ns)
 api.add_namespace(agencies_ns)
@@ -161,6 +175,7 @@ api.add_namespace(telescopes_ns)
 api.add_namespace(museums_ns)
 api.add_namespace(people_ns)
 api.add_namespace(images_ns)
+api.add_namespace(sync_ns)
 
 # Define response models
 term_model = api.model('Term', {
@@ -266,13 +281,80 @@ image_model = api.model('Image', {
     'thumbnail': fields.String(description='Thumbnail URL')
 })
 
+# Compact record model
+INTERNED_FIELDS = ('category', 'country', 'type')
+
+def intern_string(value):
+    return sys.intern(str(value))
+
+def string_tuple(values):
+    return tuple(str(value) for value in values)
+
+class Record:
+    """Base for the __slots__ record classes built from the response models"""
+    __slots__ = ()
+    _converters = ()
+
+    def __init__(self, data):
+        for name, convert in self._converters:
+            value = data.get(name)
+            setattr(self, name, None if value is None else convert(value))
+
+def record_class(model):
+    """Build a __slots__ record class with a precompiled serializer for a response model"""
+    names = tuple(model)
+    converters = []
+    for name, field in model.items():
+        if isinstance(field, fields.List):
+            converters.append((name, string_tuple))
+        elif isinstance(field, fields.Integer):
+            converters.append((name, int))
+        elif isinstance(field, fields.String):
+            converters.append((name, intern_string if name in INTERNED_FIELDS else str))
+        else:
+            raise TypeError(f'Unsupported field type {type(field).__name__} for {model.name}.{name}')
+
+    # Values are normalised on load, so serializing only reads the slots in model field order
+    getter = operator.attrgetter(*names)
+
+    def to_dict(self):
+        return dict(zip(names, getter(self)))
+
+    return type(f'{model.name}Record', (Record,), {
+        '__slots__': names,
+        '_converters': tuple(converters),
+        'to_dict': to_dict
+    })
+
+TermRecord = record_class(term_model)
+AgencyRecord = record_class(agency_model)
+PlanetRecord = record_class(planet_model)
+RocketRecord = record_class(rocket_model)
+AstronautRecord = record_class(astronaut_model)
+TelescopeRecord = record_class(telescope_model)
+MuseumRecord = record_class(museum_model)
+NotablePersonRecord = record_class(notable_person_model)
+
+def serialize_with(ns, model, as_list=False):
+    """Document a response like ns.marshal_with, but serialize records with their to_dict()"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            resp = func(*args, **kwargs)
+            data = [record.to_dict() for record in resp] if as_list else resp.to_dict()
+            # Honour the X-Fields mask header exactly as the marshaller does
+            mask = request.headers.get(current_app.config['RESTX_MASK_HEADER'])
+            return apply_mask(data, mask, skip=True) if mask else data
+        return ns.doc(responses={'200': (None, [model] if as_list else model, {})}, __mask__=True)(wrapper)
+    return decorator
+
 # Space Terms API
 @terms_ns.route('/')
 class TermsList(Resource):
     @terms_ns.doc('get_terms')
     @terms_ns.param('letter', 'Filter by starting letter')
     @terms_ns.param('search', 'Search in term name, description, or category')
-    @terms_ns.marshal_list_with(term_model)
+    @serialize_with(terms_ns, term_model, as_list=True)
     def get(self):
         """Get all space terms with optional filtering"""
         terms = load_space_terms()
@@ -280,29 +362,29 @@ class TermsList(Resource):
         # Filter by letter if provided
         letter = request.args.get('letter', '').upper()
         if letter:
-            terms = [term for term in terms if term['term'].upper().startswith(letter)]
+            terms = [term for term in terms if term.term.upper().startswith(letter)]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             terms = [term for term in terms if 
-                    search_query in term['term'].lower() or 
-                    search_query in term['short_description'].lower() or
-                    search_query in term['category'].lower()]
+                    search_query in term.term.lower() or 
+                    search_query in term.short_description.lower() or
+                    search_query in term.category.lower()]
         
         # Sort alphabetically
-        terms.sort(key=lambda x: x['term'].lower())
+        terms.sort(key=lambda x: x.term.lower())
         
         return terms
 
 @terms_ns.route('/<string:term_id>')
 class Term(Resource):
     @terms_ns.doc('get_term')
-    @terms_ns.marshal_with(term_model)
+    @serialize_with(terms_ns, term_model)
     def get(self, term_id):
         """Get a specific term by ID"""
         terms = load_space_terms()
-        term = next((t for t in terms if t['id'] == term_id), None)
+        term = next((t for t in terms if t.id == term_id), None)
         
         if term:
             return term
@@ -315,7 +397,7 @@ class Categories(Resource):
     def get(self):
         """Get all available term categories"""
         terms = load_space_terms()
-        categories = list(set(term['category'] for term in terms))
+        categories = list(set(term.category for term in terms))
         categories.sort()
         return categories
 
@@ -328,7 +410,7 @@ class AlphabetStats(Resource):
         alphabet_stats = {}
         
         for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-            count = len([term for term in terms if term['term'].upper().startswith(letter)])
+            count = len([term for term in terms if term.term.upper().startswith(letter)])
             alphabet_stats[letter] = count
         
         return alphabet_stats
@@ -340,7 +422,7 @@ class AgenciesList(Resource):
     @agencies_ns.param('type', 'Filter by agency type')
     @agencies_ns.param('country', 'Filter by country')
     @agencies_ns.param('search', 'Search in agency name, full name, country, or description')
-    @agencies_ns.marshal_list_with(agency_model)
+    @serialize_with(agencies_ns, agency_model, as_list=True)
     def get(self):
         """Get all space agencies with optional filtering"""
         agencies = load_space_agencies()
@@ -348,35 +430,35 @@ class AgenciesList(Resource):
         # Filter by type if provided
         agency_type = request.args.get('type', '').lower()
         if agency_type and agency_type != 'all':
-            agencies = [agency for agency in agencies if agency['type'].lower() == agency_type]
+            agencies = [agency for agency in agencies if agency.type.lower() == agency_type]
         
         # Filter by country if provided
         country = request.args.get('country', '')
         if country and country != 'all':
-            agencies = [agency for agency in agencies if agency['country'].lower() == country.lower()]
+            agencies = [agency for agency in agencies if agency.country.lower() == country.lower()]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             agencies = [agency for agency in agencies if 
-                       search_query in agency['name'].lower() or 
-                       search_query in agency['full_name'].lower() or
-                       search_query in agency['country'].lower() or
-                       search_query in agency['description'].lower()]
+                       search_query in agency.name.lower() or 
+                       search_query in agency.full_name.lower() or
+                       search_query in agency.country.lower() or
+                       search_query in agency.description.lower()]
         
         # Sort alphabetically
-        agencies.sort(key=lambda x: x['name'].lower())
+        agencies.sort(key=lambda x: x.name.lower())
         
         return agencies
 
 @agencies_ns.route('/<string:agency_id>')
 class Agency(Resource):
     @agencies_ns.doc('get_agency')
-    @agencies_ns.marshal_with(agency_model)
+    @serialize_with(agencies_ns, agency_model)
     def get(self, agency_id):
         """Get a specific agency by ID"""
         agencies = load_space_agencies()
-        agency = next((a for a in agencies if a['id'] == agency_id), None)
+        agency = next((a for a in agencies if a.id == agency_id), None)
         
         if agency:
             return agency
@@ -389,7 +471,7 @@ class PlanetsList(Resource):
     @planets_ns.doc('get_planets')
     @planets_ns.param('type', 'Filter by planet type')
     @planets_ns.param('search', 'Search in planet name, description, or type')
-    @planets_ns.marshal_list_with(planet_model)
+    @serialize_with(planets_ns, planet_model, as_list=True)
     def get(self):
         """Get all planets with optional filtering"""
         planets = load_planets()
@@ -397,30 +479,30 @@ class PlanetsList(Resource):
         # Filter by type if provided
         planet_type = request.args.get('type', '').lower()
         if planet_type and planet_type != 'all':
-            planets = [planet for planet in planets if planet['type'].lower() == planet_type]
+            planets = [planet for planet in planets if planet.type.lower() == planet_type]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             planets = [planet for planet in planets if 
-                      search_query in planet['name'].lower() or 
-                      search_query in planet['description'].lower() or
-                      search_query in planet['type'].lower()]
+                      search_query in planet.name.lower() or 
+                      search_query in planet.description.lower() or
+                      search_query in planet.type.lower()]
         
         # Sort by distance from sun (inner to outer)
         distance_order = ['mercury', 'venus', 'earth', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune']
-        planets.sort(key=lambda x: distance_order.index(x['id']) if x['id'] in distance_order else 999)
+        planets.sort(key=lambda x: distance_order.index(x.id) if x.id in distance_order else 999)
         
         return planets
 
 @planets_ns.route('/<string:planet_id>')
 class Planet(Resource):
     @planets_ns.doc('get_planet')
-    @planets_ns.marshal_with(planet_model)
+    @serialize_with(planets_ns, planet_model)
     def get(self, planet_id):
         """Get a specific planet by ID"""
         planets = load_planets()
-        planet = next((p for p in planets if p['id'] == planet_id), None)
+        planet = next((p for p in planets if p.id == planet_id), None)
         
         if planet:
             return planet
@@ -433,7 +515,7 @@ class RocketsList(Resource):
     @rockets_ns.doc('get_rockets')
     @rockets_ns.param('type', 'Filter by rocket type')
     @rockets_ns.param('search', 'Search in rocket name, description, or type')
-    @rockets_ns.marshal_list_with(rocket_model)
+    @serialize_with(rockets_ns, rocket_model, as_list=True)
     def get(self):
         """Get all rockets with optional filtering"""
         rockets = load_rockets()
@@ -441,29 +523,29 @@ class RocketsList(Resource):
         # Filter by type if provided
         rocket_type = request.args.get('type', '').lower()
         if rocket_type and rocket_type != 'all':
-            rockets = [rocket for rocket in rockets if rocket['type'].lower() == rocket_type]
+            rockets = [rocket for rocket in rockets if rocket.type.lower() == rocket_type]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             rockets = [rocket for rocket in rockets if 
-                      search_query in rocket['name'].lower() or 
-                      search_query in rocket['description'].lower() or
-                      search_query in rocket['type'].lower()]
+                      search_query in rocket.name.lower() or 
+                      search_query in (rocket.description or '').lower() or
+                      search_query in rocket.type.lower()]
         
         # Sort alphabetically
-        rockets.sort(key=lambda x: x['name'].lower())
+        rockets.sort(key=lambda x: x.name.lower())
         
         return rockets
 
 @rockets_ns.route('/<string:rocket_id>')
 class Rocket(Resource):
     @rockets_ns.doc('get_rocket')
-    @rockets_ns.marshal_with(rocket_model)
+    @serialize_with(rockets_ns, rocket_model)
     def get(self, rocket_id):
         """Get a specific rocket by ID"""
         rockets = load_rockets()
-        rocket = next((r for r in rockets if r['id'] == rocket_id), None)
+        rocket = next((r for r in rockets if r.id == rocket_id), None)
         
         if rocket:
             return rocket
@@ -477,7 +559,7 @@ class AstronautsList(Resource):
     @astronauts_ns.param('country', 'Filter by country')
     @astronauts_ns.param('type', 'Filter by astronaut type')
     @astronauts_ns.param('search', 'Search in astronaut name, description, country, or agency')
-    @astronauts_ns.marshal_list_with(astronaut_model)
+    @serialize_with(astronauts_ns, astronaut_model, as_list=True)
     def get(self):
         """Get all astronauts with optional filtering"""
         astronauts = load_astronauts()
@@ -485,35 +567,35 @@ class AstronautsList(Resource):
         # Filter by country if provided
         country = request.args.get('country', '')
         if country and country != 'all':
-            astronauts = [astronaut for astronaut in astronauts if astronaut['country'].lower() == country.lower()]
+            astronauts = [astronaut for astronaut in astronauts if astronaut.country.lower() == country.lower()]
         
         # Filter by agency type if provided
         agency_type = request.args.get('type', '').lower()
         if agency_type and agency_type != 'all':
-            astronauts = [astronaut for astronaut in astronauts if astronaut['type'].lower() == agency_type]
+            astronauts = [astronaut for astronaut in astronauts if astronaut.type.lower() == agency_type]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             astronauts = [astronaut for astronaut in astronauts if 
-                         search_query in astronaut['name'].lower() or 
-                         search_query in astronaut['description'].lower() or
-                         search_query in astronaut['country'].lower() or
-                         search_query in astronaut['agency'].lower()]
+                         search_query in astronaut.name.lower() or 
+                         search_query in astronaut.description.lower() or
+                         search_query in astronaut.country.lower() or
+                         search_query in astronaut.agency.lower()]
         
         # Sort alphabetically by name
-        astronauts.sort(key=lambda x: x['name'].lower())
+        astronauts.sort(key=lambda x: x.name.lower())
         
         return astronauts
 
 @astronauts_ns.route('/<string:astronaut_id>')
 class Astronaut(Resource):
     @astronauts_ns.doc('get_astronaut')
-    @astronauts_ns.marshal_with(astronaut_model)
+    @serialize_with(astronauts_ns, astronaut_model)
     def get(self, astronaut_id):
         """Get a specific astronaut by ID"""
         astronauts = load_astronauts()
-        astronaut = next((a for a in astronauts if a['id'] == astronaut_id), None)
+        astronaut = next((a for a in astronauts if a.id == astronaut_id), None)
         
         if astronaut:
             return astronaut
@@ -527,7 +609,7 @@ class TelescopesList(Resource):
     @telescopes_ns.param('type', 'Filter by telescope type')
     @telescopes_ns.param('country', 'Filter by country')
     @telescopes_ns.param('search', 'Search in telescope name, description, country, or inventor')
-    @telescopes_ns.marshal_list_with(telescope_model)
+    @serialize_with(telescopes_ns, telescope_model, as_list=True)
     def get(self):
         """Get all telescopes with optional filtering"""
         telescopes = load_telescopes()
@@ -535,35 +617,35 @@ class TelescopesList(Resource):
         # Filter by type if provided
         telescope_type = request.args.get('type', '').lower()
         if telescope_type and telescope_type != 'all':
-            telescopes = [telescope for telescope in telescopes if telescope['type'].lower() == telescope_type]
+            telescopes = [telescope for telescope in telescopes if telescope.type.lower() == telescope_type]
         
         # Filter by country if provided
         country = request.args.get('country', '')
         if country and country != 'all':
-            telescopes = [telescope for telescope in telescopes if telescope.get('country', '').lower() == country.lower()]
+            telescopes = [telescope for telescope in telescopes if (telescope.country or '').lower() == country.lower()]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             telescopes = [telescope for telescope in telescopes if 
-                         search_query in telescope['name'].lower() or 
-                         search_query in telescope.get('description', '').lower() or
-                         search_query in telescope.get('country', '').lower() or
-                         search_query in telescope.get('inventor', '').lower()]
+                         search_query in telescope.name.lower() or 
+                         search_query in (telescope.description or '').lower() or
+                         search_query in (telescope.country or '').lower() or
+                         search_query in (telescope.inventor or '').lower()]
         
         # Sort by year (newest first)
-        telescopes.sort(key=lambda x: x.get('year', 0), reverse=True)
+        telescopes.sort(key=lambda x: (x.year or 0), reverse=True)
         
         return telescopes
 
 @telescopes_ns.route('/<string:telescope_id>')
 class Telescope(Resource):
     @telescopes_ns.doc('get_telescope')
-    @telescopes_ns.marshal_with(telescope_model)
+    @serialize_with(telescopes_ns, telescope_model)
     def get(self, telescope_id):
         """Get a specific telescope by ID"""
         telescopes = load_telescopes()
-        telescope = next((t for t in telescopes if t['id'] == telescope_id), None)
+        telescope = next((t for t in telescopes if t.id == telescope_id), None)
         
         if telescope:
             return telescope
@@ -576,7 +658,7 @@ class MuseumsList(Resource):
     @museums_ns.doc('get_museums')
     @museums_ns.param('country', 'Filter by country')
     @museums_ns.param('search', 'Search in museum name, country, city, or what they are famous for')
-    @museums_ns.marshal_list_with(museum_model)
+    @serialize_with(museums_ns, museum_model, as_list=True)
     def get(self):
         """Get all space museums with optional filtering"""
         museums = load_museums()
@@ -584,32 +666,32 @@ class MuseumsList(Resource):
         # Filter by country if provided
         country = request.args.get('country', '')
         if country and country != 'all':
-            museums = [museum for museum in museums if museum['country'].lower() == country.lower()]
+            museums = [museum for museum in museums if museum.country.lower() == country.lower()]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             museums = [museum for museum in museums if 
-                      search_query in museum['name'].lower() or 
-                      search_query in museum['country'].lower() or
-                      search_query in museum['city_or_region'].lower() or
-                      search_query in museum['famous_for'].lower()]
+                      search_query in museum.name.lower() or 
+                      search_query in museum.country.lower() or
+                      search_query in museum.city_or_region.lower() or
+                      search_query in museum.famous_for.lower()]
         
         # Sort by annual visitors (highest first)
-        museums.sort(key=lambda x: x.get('annual_visitors', 0), reverse=True)
+        museums.sort(key=lambda x: (x.annual_visitors or 0), reverse=True)
         
         return museums
 
 @museums_ns.route('/<string:museum_name>')
 class Museum(Resource):
     @museums_ns.doc('get_museum')
-    @museums_ns.marshal_with(museum_model)
+    @serialize_with(museums_ns, museum_model)
     def get(self, museum_name):
         """Get a specific museum by name"""
         museums = load_museums()
         # Replace URL encoding and normalize name for search
         museum_name_normalized = museum_name.replace('%20', ' ').replace('_', ' ').lower()
-        museum = next((m for m in museums if m['name'].lower() == museum_name_normalized), None)
+        museum = next((m for m in museums if m.name.lower() == museum_name_normalized), None)
         
         if museum:
             return museum
@@ -622,7 +704,7 @@ class PeopleList(Resource):
     @people_ns.doc('get_people')
     @people_ns.param('country', 'Filter by country')
     @people_ns.param('search', 'Search in person name, country, contribution, or known for')
-    @people_ns.marshal_list_with(notable_person_model)
+    @serialize_with(people_ns, notable_person_model, as_list=True)
     def get(self):
         """Get all notable space contributors with optional filtering"""
         people = load_notable_people()
@@ -630,32 +712,32 @@ class PeopleList(Resource):
         # Filter by country if provided
         country = request.args.get('country', '')
         if country and country != 'all':
-            people = [person for person in people if person['country'].lower() == country.lower()]
+            people = [person for person in people if person.country.lower() == country.lower()]
         
         # Filter by search query if provided
         search_query = request.args.get('search', '').lower()
         if search_query:
             people = [person for person in people if 
-                     search_query in person['name'].lower() or 
-                     search_query in person['country'].lower() or
-                     search_query in person['contribution'].lower() or
-                     search_query in person['known_for'].lower()]
+                     search_query in person.name.lower() or 
+                     search_query in person.country.lower() or
+                     search_query in person.contribution.lower() or
+                     search_query in person.known_for.lower()]
         
         # Sort alphabetically by name
-        people.sort(key=lambda x: x['name'].lower())
+        people.sort(key=lambda x: x.name.lower())
         
         return people
 
 @people_ns.route('/<string:person_name>')
 class Person(Resource):
     @people_ns.doc('get_person')
-    @people_ns.marshal_with(notable_person_model)
+    @serialize_with(people_ns, notable_person_model)
     def get(self, person_name):
         """Get a specific notable person by name"""
         people = load_notable_people()
         # Replace URL encoding and normalize name for search
         person_name_normalized = person_name.replace('%20', ' ').replace('_', ' ').lower()
-        person = next((p for p in people if p['name'].lower() == person_name_normalized), None)
+        person = next((p for p in people if p.name.lower() == person_name_normalized), None)
         
         if person:
             return person
@@ -683,53 +765,525 @@ class ImagesList(Resource):
         
         return result
 
+# Catalogue versioning for delta sync
+SYNC_COLLECTIONS = {
+    'terms': (load_space_terms, 'id'),
+    'agencies': (load_space_agencies, 'id'),
+    'planets': (load_planets, 'id'),
+    'rockets': (load_rockets, 'id'),
+    'astronauts': (load_astronauts, 'id'),
+    'telescopes': (load_telescopes, 'id'),
+    'museums': (load_museums, 'name'),
+    'people': (load_notable_people, 'name')
+}
+SYNC_HISTORY_LIMIT = 50  # Catalogue versions a mirror can be behind before a full resync
+# Shared by the workers and kept across restarts; point at persistent storage on ephemeral hosts
+SYNC_LOG_PATH = os.environ.get('SYNC_LOG_PATH', 'sync_changelog.json')
+
+_sync_lock = threading.Lock()
+_sync_state = {
+    'data_version': None,
+    'version': None,
+    'collections': {},  # collection -> {'version': str, 'records': {key: (revision, record)}}
+    'changelog': []     # [[catalogue version, [[collection, key, op], ...]]], oldest first
+}
+
+def record_revision(record):
+    """Content hash of a single record"""
+    encoded = json.dumps(record.to_dict(), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:12]
+
+def index_collection(records, key_field):
+    """Map each record key to its revision and compute the collection version"""
+    indexed = {}
+    for record in records:
+        key = getattr(record, key_field)
+        if key is None:
+            print(f"Skipping record without '{key_field}' in sync index")
+            continue
+        indexed[key] = (record_revision(record), record)
+    digest = hashlib.sha1()
+    for key in sorted(indexed):
+        digest.update(f"{key}:{indexed[key][0]};".encode('utf-8'))
+    return {'version': digest.hexdigest()[:16], 'records': indexed}
+
+def collection_revisions(collection):
+    return {key: revision for key, (revision, _) in collection['records'].items()}
+
+def diff_collection(old_revisions, new_records):
+    """List (key, op) changes between the last indexed revisions and a new index of a collection"""
+    changes = []
+    for key, (revision, _) in new_records.items():
+        if key not in old_revisions:
+            changes.append((key, 'added'))
+        elif old_revisions[key] != revision:
+            changes.append((key, 'changed'))
+    for key in old_revisions:
+        if key not in new_records:
+            changes.append((key, 'removed'))
+    return changes
+
+def read_sync_log():
+    """Load the persisted changelog and last indexed revisions, or None if unavailable"""
+    try:
+        with open(SYNC_LOG_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error reading sync changelog: {e}")
+        return None
+
+def write_sync_log(log):
+    """Persist the changelog atomically so the other worker never reads a partial file"""
+    tmp_path = f"{SYNC_LOG_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(log, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, SYNC_LOG_PATH)
+    except OSError as e:
+        print(f"Error writing sync changelog: {e}")
+
+def refresh_sync_state():
+    """Reindex the catalogue when data files change and record the delta in the changelog"""
+    current_data_version = data_version()
+    with _sync_lock:
+        if _sync_state['data_version'] == current_data_version:
+            return _sync_state
+
+        collections = {name: index_collection(loader(), key_field)
+                       for name, (loader, key_field) in SYNC_COLLECTIONS.items()}
+        digest = hashlib.sha1()
+        for name in sorted(collections):
+            digest.update(f"{name}:{collections[name]['version']};".encode('utf-8'))
+        version = digest.hexdigest()[:16]
+
+        # Diff against the persisted log so deltas survive restarts and match across workers,
+        # falling back to this worker's own state when the file cannot be read
+        log = read_sync_log() or {
+            'version': _sync_state['version'],
+            'revisions': {name: collection_revisions(collection)
+                          for name, collection in _sync_state['collections'].items()},
+            'changelog': _sync_state['changelog']
+        }
+        if log['version'] != version:
+            if log['version'] is not None:
+                changes = []
+                for name, collection in collections.items():
+                    old_revisions = log['revisions'].get(name, {})
+                    changes.extend([name, key, op] for key, op in diff_collection(old_revisions, collection['records']))
+                log['changelog'].append([version, changes])
+                del log['changelog'][:-SYNC_HISTORY_LIMIT]
+            else:
+                log['changelog'] = [[version, []]]
+            log['version'] = version
+            log['revisions'] = {name: collection_revisions(collection) for name, collection in collections.items()}
+            write_sync_log(log)
+
+        _sync_state['data_version'] = current_data_version
+        _sync_state['version'] = version
+        _sync_state['collections'] = collections
+        _sync_state['changelog'] = log['changelog']
+        return _sync_state
+
+def sync_entry(key, revision, record):
+    return {'key': key, 'revision': revision, 'data': record.to_dict()}
+
+def build_sync_delta(state, since):
+    """Return changes since a catalogue version, or a full snapshot if it is unknown"""
+    versions = [version for version, _ in state['changelog']]
+    delta = {'version': state['version'], 'since': since or None, 'full': since not in versions, 'collections': {}}
+
+    if delta['full']:
+        for name, collection in state['collections'].items():
+            delta['collections'][name] = {
+                'version': collection['version'],
+                'added': [sync_entry(key, revision, record) for key, (revision, record) in collection['records'].items()],
+                'changed': [],
+                'removed': []
+            }
+        return delta
+
+    # Collapse every change after the latest occurrence of `since` (a revert can repeat a version)
+    # into one net operation per record
+    since_index = len(versions) - 1 - versions[::-1].index(since)
+    net_ops = {}
+    for _, changes in state['changelog'][since_index + 1:]:
+        for name, key, op in changes:
+            net_ops.setdefault((name, key), op)
+
+    for (name, key), first_op in net_ops.items():
+        collection = state['collections'][name]
+        bucket = delta['collections'].setdefault(name, {
+            'version': collection['version'], 'added': [], 'changed': [], 'removed': []
+        })
+        current = collection['records'].get(key)
+        if current is None:
+            if first_op != 'added':
+                bucket['removed'].append(key)
+        elif first_op == 'added':
+            bucket['added'].append(sync_entry(key, *current))
+        else:
+            bucket['changed'].append(sync_entry(key, *current))
+
+    delta['collections'] = {name: bucket for name, bucket in delta['collections'].items()
+                            if bucket['added'] or bucket['changed'] or bucket['removed']}
+    return delta
+
+# Sync API
+@sync_ns.route('', '/')
+class Sync(Resource):
+    @sync_ns.doc('get_sync')
+    @sync_ns.param('since', 'Catalogue version the client already has (omit for a full snapshot)')
+    def get(self):
+        """Get records added, changed or removed since a catalogue version"""
+        since = request.args.get('since', '')
+        state = refresh_sync_state()
+        return build_sync_delta(state, since)
+
+# Admission control: per-client rate limits and upstream concurrency
+RATE_LIMITS = {
+    # route class -> (tokens refilled per second, bucket size)
+    'local': (10.0, 40),
+    'upstream': (0.5, 5)
+}
+UPSTREAM_PREFIXES = ('/api/images',)
+UPSTREAM_CONCURRENCY = 1  # Shared across workers, so one of the two always stays free for catalogue routes
+UPSTREAM_RETRY_AFTER = 2
+UPSTREAM_SLOT_LEASE = 130  # gunicorn kills a stuck worker after 120 s, its slot is reclaimed after this
+# Proxies that append to X-Forwarded-For in front of the app; Heroku's router (DYNO is set) is one
+TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', '1' if 'DYNO' in os.environ else '0'))
+RATE_LIMIT_DB = os.environ.get('RATE_LIMIT_DB', os.path.join(tempfile.gettempdir(), 'cosmopedia_rate_limits.sqlite3'))
+
+class SqliteRateLimitBackend:
+    """Token buckets and concurrency slots in a SQLite file shared by the workers on this host.
+
+    Any object with the same take/acquire/release methods (for example one
+    backed by Redis) can replace it to share limits across hosts.
+    """
+
+    def __init__(self, path, max_buckets=10000, prune_every=1000):
+        self.path = path
+        self.max_buckets = max_buckets
+        self.prune_every = prune_every
+        self._takes = 0
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection()  # Fail early so the caller can fall back
+
+    def _connection(self):
+        # SQLite connections must not cross the fork into gunicorn workers
+        if self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')  # Limiter state is disposable, skip fsync per request
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL, full_at REAL);
+                CREATE INDEX IF NOT EXISTS buckets_updated ON buckets (updated);
+                CREATE INDEX IF NOT EXISTS buckets_full_at ON buckets (full_at);
+                CREATE TABLE IF NOT EXISTS slots (id INTEGER PRIMARY KEY, name TEXT, expires REAL);
+            ''')
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    def take(self, key, rate, burst):
+        """Take one token from the bucket, returning 0 or the seconds until one is available"""
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                row = conn.execute('SELECT tokens, updated FROM buckets WHERE key = ?', (key,)).fetchone()
+                tokens, updated = row if row else (burst, now)
+                tokens = min(burst, tokens + max(0, now - updated) * rate)
+                wait = 0 if tokens >= 1 else (1 - tokens) / rate
+                if not wait:
+                    tokens -= 1
+                conn.execute('INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)',
+                             (key, tokens, now, now + (burst - tokens) / rate))
+
+                self._takes += 1
+                if self._takes % self.prune_every == 0:
+                    self._prune(conn, now)
+                return wait
+        except sqlite3.Error as e:
+            print(f"Rate limit backend error: {e}")
+            return 0
+
+    def _prune(self, conn, now):
+        # Refilled buckets carry no state, then evict the least recently used beyond the cap
+        conn.execute('DELETE FROM buckets WHERE full_at <= ?', (now,))
+        excess = conn.execute('SELECT COUNT(*) FROM buckets').fetchone()[0] - self.max_buckets
+        if excess > 0:
+            conn.execute('DELETE FROM buckets WHERE key IN (SELECT key FROM buckets ORDER BY updated LIMIT ?)', (excess,))
+
+    def acquire(self, name, limit):
+        """Claim one of limit concurrent slots, returning a slot handle or None when all are taken"""
+        now = time.time()
+        try:
+            with self._transaction() as conn:
+                conn.execute('DELETE FROM slots WHERE expires <= ?', (now,))
+                active = conn.execute('SELECT COUNT(*) FROM slots WHERE name = ?', (name,)).fetchone()[0]
+                if active >= limit:
+                    return None
+                return conn.execute('INSERT INTO slots (name, expires) VALUES (?, ?)',
+                                    (name, now + UPSTREAM_SLOT_LEASE)).lastrowid
+        except sqlite3.Error as e:
+            print(f"Rate limit backend error: {e}")
+            return 0
+
+    def release(self, name, slot):
+        try:
+            with self._transaction() as conn:
+                conn.execute('DELETE FROM slots WHERE id = ?', (slot,))
+        except sqlite3.Error as e:
+            print(f"Rate limit backend error: {e}")
+
+class MemoryRateLimitBackend:
+    """In-process token buckets and concurrency counters, only for a single process"""
+
+    def __init__(self, max_buckets=10000):
+        self.max_buckets = max_buckets
+        self._buckets = OrderedDict()  # key -> (tokens, updated), least recently used first
+        self._active = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst):
+        """Take one token from the bucket, returning 0 or the seconds until one is available"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            wait = 0 if tokens >= 1 else (1 - tokens) / rate
+            if not wait:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+            return wait
+
+    def acquire(self, name, limit):
+        """Claim one of limit concurrent slots, returning a slot handle or None when all are taken"""
+        with self._lock:
+            if self._active.get(name, 0) >= limit:
+                return None
+            self._active[name] = self._active.get(name, 0) + 1
+            return True
+
+    def release(self, name, slot):
+        with self._lock:
+            self._active[name] = max(0, self._active.get(name, 0) - 1)
+
+def create_rate_limit_backend():
+    """Share limits between the workers on this host, falling back to per-process limits"""
+    try:
+        return SqliteRateLimitBackend(RATE_LIMIT_DB)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Rate limit database unavailable, limits apply per worker: {e}")
+        return MemoryRateLimitBackend()
+
+rate_limit_backend = create_rate_limit_backend()
+
+# Only trust X-Forwarded-For when a router that appends to it sits in front, otherwise it is spoofable
+if TRUSTED_PROXIES:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES)
+
+def shed_load(status, message, retry_after):
+    response = jsonify({'message': message})
+    response.status_code = status
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+@app.before_request
+def admission_control():
+    """Reject over-limit clients with 429 and shed upstream load with 503 before doing any work"""
+    if not request.path.startswith('/api/'):
+        return None
+
+    route_class = 'upstream' if request.path.startswith(UPSTREAM_PREFIXES) else 'local'
+    rate, burst = RATE_LIMITS[route_class]
+    wait = rate_limit_backend.take(f"{route_class}:{request.remote_addr or 'unknown'}", rate, burst)
+    if wait:
+        return shed_load(429, 'Rate limit exceeded, please retry later', wait)
+
+    if route_class == 'upstream':
+        slot = rate_limit_backend.acquire('upstream', UPSTREAM_CONCURRENCY)
+        if slot is None:
+            return shed_load(503, 'Upstream service busy, please retry later', UPSTREAM_RETRY_AFTER)
+        g.upstream_slot = slot
+    return None
+
+@app.teardown_request
+def release_upstream_slot(exc):
+    slot = g.pop('upstream_slot', None)
+    if slot is not None:
+        rate_limit_backend.release('upstream', slot)
+
+# Response caching for the homepage, Swagger spec and static assets
+ASSET_MAX_AGE = 365 * 24 * 3600  # Fingerprinted URLs change with content, so cache for a year
+INDEX_ASSETS = ('css/style.css', 'js/script.js')
+
+_static_fingerprints = {}
+_rendered_cache = {}
+
+def data_version():
+    """Fingerprint of the data files, changes whenever one of them is edited"""
+    digest = hashlib.sha1()
+    try:
+        for name in sorted(os.listdir('data')):
+            if name.endswith('.json'):
+                stat = os.stat(os.path.join('data', name))
+                digest.update(f"{name}:{stat.st_mtime_ns}:{stat.st_size};".encode('utf-8'))
+    except FileNotFoundError:
+        pass
+    return digest.hexdigest()[:16]
+
+def static_fingerprint(filename):
+    """Short content hash of a static file, recomputed only when the file changes"""
+    try:
+        mtime = os.stat(os.path.join(app.static_folder, filename)).st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _static_fingerprints.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        fingerprint = hashlib.sha1(f.read()).hexdigest()[:12]
+    _static_fingerprints[filename] = (mtime, fingerprint)
+    return fingerprint
+
+class CachedBody:
+    """Encoded response body kept together with its gzip form and ETag"""
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.gzipped = gzip.compress(body, compresslevel=6)
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.mimetype = mimetype
+
+    def to_response(self):
+        """Build a conditional response, compressed when the client accepts gzip"""
+        if request.accept_encodings['gzip'] > 0:
+            response = app.response_class(self.gzipped, mimetype=self.mimetype)
+            response.headers['Content-Encoding'] = 'gzip'
+            response.set_etag(self.etag + '-gz')
+        else:
+            response = app.response_class(self.body, mimetype=self.mimetype)
+            response.set_etag(self.etag)
+        response.vary.add('Accept-Encoding')
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+def cached_body(name, version, build, mimetype):
+    """Return the cached body for name, rebuilding it when version changes"""
+    entry = _rendered_cache.get(name)
+    if entry is None or entry[0] != version:
+        entry = (version, CachedBody(build(), mimetype))
+        _rendered_cache[name] = entry
+    return entry[1]
+
+@app.url_defaults
+def add_static_fingerprint(endpoint, values):
+    """Append a content fingerprint to static URLs so they can be cached long-term"""
+    if endpoint == 'static' and 'v' not in values:
+        fingerprint = static_fingerprint(values.get('filename', ''))
+        if fingerprint:
+            values['v'] = fingerprint
+
+@app.after_request
+def cache_fingerprinted_static(response):
+    """Mark static files requested with their current fingerprint as immutable"""
+    if request.endpoint == 'static' and response.status_code in (200, 304):
+        fingerprint = static_fingerprint((request.view_args or {}).get('filename', ''))
+        if fingerprint and request.args.get('v') == fingerprint:
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = ASSET_MAX_AGE
+            response.cache_control.immutable = True
+    return response
+
+def swagger_spec():
+    """Serve the generated Swagger spec from its encoded, compressed cache"""
+    schema = api.__schema__
+    if 'error' in schema:
+        return jsonify(schema), 500
+
+    spec = cached_body('swagger', api.version, lambda: json.dumps(schema).encode('utf-8'), 'application/json')
+    return spec.to_response()
+
+# flask-restx re-encodes the spec on every hit, serve the cached bytes instead
+app.view_functions['specs'] = swagger_spec
+
+def collect_stats():
+    """Count records per collection and unique countries for the homepage"""
+    terms_count = len(load_space_terms())
+    agencies_count = len(load_space_agencies()) 
+    planets_count = len(load_planets())
+    rockets_count = len(load_rockets())
+    astronauts_count = len(load_astronauts())
+    telescopes_count = len(load_telescopes())
+    museums_count = len(load_museums())
+    people_count = len(load_notable_people())
+    
+    # Count unique countries
+    countries = set()
+    for agency in load_space_agencies():
+        if agency.country is not None:
+            countries.add(agency.country)
+    for astronaut in load_astronauts():
+        if astronaut.country is not None:
+            countries.add(astronaut.country)
+    for person in load_notable_people():
+        if person.country is not None:
+            countries.add(person.country)
+    for museum in load_museums():
+        if museum.country is not None:
+            countries.add(museum.country)
+    
+    countries_count = len(countries)
+    total_data_points = terms_count + agencies_count + planets_count + rockets_count + astronauts_count + telescopes_count + museums_count + people_count
+    
+    return {
+        'terms': terms_count,
+        'agencies': agencies_count,
+        'planets': planets_count,
+        'rockets': rockets_count,
+        'astronauts': astronauts_count,
+        'telescopes': telescopes_count,
+        'museums': museums_count,
+        'people': people_count,
+        'countries': countries_count,
+        'total': total_data_points
+    }
+
 # Index route for the awesome homepage with dynamic stats
 @app.route('/')
 def index():
     """Serve the awesome index page with real data counts"""
-    # Get actual counts from data files
+    # Rendered once per data and asset version, then served from memory
     try:
-        terms_count = len(load_space_terms())
-        agencies_count = len(load_space_agencies()) 
-        planets_count = len(load_planets())
-        rockets_count = len(load_rockets())
-        astronauts_count = len(load_astronauts())
-        telescopes_count = len(load_telescopes())
-        museums_count = len(load_museums())
-        people_count = len(load_notable_people())
-        
-        # Count unique countries
-        countries = set()
-        for agency in load_space_agencies():
-            if 'country' in agency:
-                countries.add(agency['country'])
-        for astronaut in load_astronauts():
-            if 'country' in astronaut:
-                countries.add(astronaut['country'])
-        for person in load_notable_people():
-            if 'country' in person:
-                countries.add(person['country'])
-        for museum in load_museums():
-            if 'country' in museum:
-                countries.add(museum['country'])
-        
-        countries_count = len(countries)
-        total_data_points = terms_count + agencies_count + planets_count + rockets_count + astronauts_count + telescopes_count + museums_count + people_count
-        
-        stats = {
-            'terms': terms_count,
-            'agencies': agencies_count,
-            'planets': planets_count,
-            'rockets': rockets_count,
-            'astronauts': astronauts_count,
-            'telescopes': telescopes_count,
-            'museums': museums_count,
-            'people': people_count,
-            'countries': countries_count,
-            'total': total_data_points
-        }
-        
-        return render_template('index.html', stats=stats)
+        version = ':'.join([data_version()] + [static_fingerprint(asset) or '' for asset in INDEX_ASSETS])
+        page = cached_body(
+            'index',
+            version,
+            lambda: render_template('index.html', stats=collect_stats()).encode('utf-8'),
+            'text/html'
+        )
+        return page.to_response()
     except Exception as e:
         print(f"Error loading stats: {e}")
         # Fallback to default stats
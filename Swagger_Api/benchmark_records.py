@@ -0,0 +1,70 @@
+"""Compare raw dict records with the __slots__ record classes.
+
+Each collection is scaled up (100x by default) and measured for memory per
+record and time to serialize the list, raw dicts going through the
+flask-restx marshaller and records through their precompiled to_dict().
+
+Usage: python benchmark_records.py [scale]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from flask_restx import marshal
+
+import app
+
+COLLECTIONS = [
+    ('terms', 'data/space_terminology.json', 'space_terms', app.term_model, app.TermRecord),
+    ('agencies', 'data/space_agencies.json', 'space_agencies', app.agency_model, app.AgencyRecord),
+    ('planets', 'data/planets.json', 'planets', app.planet_model, app.PlanetRecord),
+    ('rockets', 'data/rockets.json', 'rockets', app.rocket_model, app.RocketRecord),
+    ('astronauts', 'data/astronauts.json', 'astronauts', app.astronaut_model, app.AstronautRecord),
+    ('telescopes', 'data/telescopes.json', 'telescopes', app.telescope_model, app.TelescopeRecord),
+    ('museums', 'data/space_museams.json', 'space_museums', app.museum_model, app.MuseumRecord),
+    ('people', 'data/notable_peoples.json', 'notable_space_contributors', app.notable_person_model, app.NotablePersonRecord)
+]
+
+def traced_size(build):
+    """Return the object built and the memory it still holds afterwards"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+def best_time(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(scale):
+    print(f"Scale: {scale}x")
+    print(f"{'collection':<12}{'records':>9}{'dict B/rec':>12}{'slots B/rec':>13}{'marshal ms':>12}{'to_dict ms':>12}{'speedup':>9}")
+
+    for name, path, key, model, record_class in COLLECTIONS:
+        with open(path, 'r', encoding='utf-8') as f:
+            # Re-parse the scaled text so every copy owns its strings, as json.load would
+            text = json.dumps(json.load(f)[key] * scale)
+
+        raw, raw_bytes = traced_size(lambda: json.loads(text))
+        records, record_bytes = traced_size(lambda: [record_class(item) for item in json.loads(text)])
+        count = len(raw)
+
+        # Both paths must produce the same JSON document
+        assert json.dumps(marshal(raw[:50], model)) == json.dumps([record.to_dict() for record in records[:50]])
+
+        marshal_time = best_time(lambda: marshal(raw, model))
+        to_dict_time = best_time(lambda: [record.to_dict() for record in records])
+
+        print(f"{name:<12}{count:>9}{raw_bytes / count:>12.0f}{record_bytes / count:>13.0f}"
+              f"{marshal_time * 1000:>12.1f}{to_dict_time * 1000:>12.1f}{marshal_time / to_dict_time:>8.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)